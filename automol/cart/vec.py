@@ -1,6 +1,7 @@
 """ vector functions
 """
 import numbers
+import itertools
 import numpy
 import transformations as tf
 
@@ -49,11 +50,20 @@ def unit_perpendicular(xyz1, xyz2, orig_xyz=(0., 0., 0.), allow_parallel=True):
 def unit_bisector(xyz1, xyz2, orig_xyz):
     """ calculate a unit bisector
     """
-    ang = central_angle(xyz1, orig_xyz, xyz2)
-    rot_ = rotater(
-        axis=unit_perpendicular(xyz1, xyz2, orig_xyz), angle=ang/2.,
-        orig_xyz=orig_xyz)
-    xyz = unit_norm(numpy.subtract(rot_(xyz1), orig_xyz))
+    # the bisector is the normalized sum of the two unit vectors, which
+    # avoids building a rotation matrix; fall back on the rotation
+    # construction when the vectors are antiparallel
+    xyz = numpy.add(unit_norm(numpy.subtract(xyz1, orig_xyz)),
+                    unit_norm(numpy.subtract(xyz2, orig_xyz)))
+    norm = numpy.linalg.norm(xyz)
+    if norm > 1e-7:
+        xyz = xyz / norm
+    else:
+        ang = central_angle(xyz1, orig_xyz, xyz2)
+        rot_ = rotater(
+            axis=unit_perpendicular(xyz1, xyz2, orig_xyz), angle=ang/2.,
+            orig_xyz=orig_xyz)
+        xyz = unit_norm(numpy.subtract(rot_(xyz1), orig_xyz))
     return xyz
 
 
@@ -118,13 +128,28 @@ def projected_central_angle(xyz1, xyz2, xyz3):
 def dihedral_angle(xyz1, xyz2, xyz3, xyz4):
     """ measure the dihedral angle defined by four atoms
     """
+    # inlined kernel (this function sits on the z-matrix/geometry hot path)
+    xyz1 = numpy.asarray(xyz1, dtype=float)
+    xyz2 = numpy.asarray(xyz2, dtype=float)
+    xyz3 = numpy.asarray(xyz3, dtype=float)
+    xyz4 = numpy.asarray(xyz4, dtype=float)
+
+    uxyz21 = xyz1 - xyz2
+    uxyz21 /= numpy.linalg.norm(uxyz21)
+    uxyz23 = xyz3 - xyz2
+    uxyz23 /= numpy.linalg.norm(uxyz23)
+    uxyz34 = xyz4 - xyz3
+    uxyz34 /= numpy.linalg.norm(uxyz34)
+
     # get the cosine of the angle
-    uxyz21 = unit_direction(xyz2, xyz1)
-    uxyz23 = unit_direction(xyz2, xyz3)
-    uxyz32 = unit_direction(xyz3, xyz2)
-    uxyz34 = unit_direction(xyz3, xyz4)
-    uxyz123_perp = unit_perpendicular(uxyz21, uxyz23)
-    uxyz234_perp = unit_perpendicular(uxyz32, uxyz34)
+    uxyz123_perp = numpy.cross(uxyz21, uxyz23)
+    norm123 = numpy.linalg.norm(uxyz123_perp)
+    uxyz123_perp = (uxyz123_perp / norm123 if norm123 > 1e-7 else
+                    numpy.zeros((3,)))
+    uxyz234_perp = numpy.cross(-uxyz23, uxyz34)
+    norm234 = numpy.linalg.norm(uxyz234_perp)
+    uxyz234_perp = (uxyz234_perp / norm234 if norm234 > 1e-7 else
+                    numpy.zeros((3,)))
     cos = numpy.dot(uxyz123_perp, uxyz234_perp)
 
     # get the sign of the angle
@@ -149,9 +174,13 @@ def dihedral_angle(xyz1, xyz2, xyz3, xyz4):
 def distance_matrix(xyzs):
     """ determine the distance matrix for a series of points
     """
-    dist_mat = tuple(tuple(distance(xyz1, xyz2) if idx1 != idx2 else 0.
-                           for idx2, xyz2 in enumerate(xyzs))
-                     for idx1, xyz1 in enumerate(xyzs))
+    # the matrix is symmetric, so compute each distance once and mirror it
+    natms = len(xyzs)
+    dist_mat = [[0.] * natms for _ in range(natms)]
+    for idx1, idx2 in itertools.combinations(range(natms), 2):
+        dist = distance(xyzs[idx1], xyzs[idx2])
+        dist_mat[idx1][idx2] = dist_mat[idx2][idx1] = dist
+    dist_mat = tuple(map(tuple, dist_mat))
     return dist_mat
 
 
@@ -176,7 +205,10 @@ def _transformer(aug_mat):
 
 def _augmented(xyz):
     assert len(xyz) == 3
-    assert all(isinstance(val, numbers.Real) for val in xyz)
+    # check the exact types first to avoid the slow ABC isinstance check in
+    # the common case
+    assert all(type(val) in (float, int) or isinstance(val, numbers.Real)
+               for val in xyz)
     xyz_aug = tuple(xyz) + (1.,)
     return xyz_aug
 
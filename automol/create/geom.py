@@ -11,7 +11,8 @@ def from_data(symbols, coordinates, angstrom=False):
     syms = list(map(pt.to_E, symbols))
     natms = len(syms)
 
-    xyzs = numpy.array(coordinates, dtype=float)
+    # asarray avoids copying when the coordinates are already a float array
+    xyzs = numpy.asarray(coordinates, dtype=float)
     assert numpy.ndim(xyzs) == 2 and numpy.shape(xyzs) == (natms, 3)
     xyzs = (xyzs if not angstrom else
             numpy.multiply(xyzs, qcc.conversion_factor('angstrom', 'bohr')))
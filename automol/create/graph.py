@@ -137,6 +137,14 @@ def from_atoms_and_bonds(atoms, bonds):
 
     bnd_dct = dict(bonds)
 
+    # if the dictionaries already conform to the graph format, skip the
+    # decomposition/re-validation round trip (the common case for graph
+    # setters, which pass in values from an already-validated graph)
+    if _conforming(atm_dct, bnd_dct):
+        atm_dct = {key: atm_dct[key] for key in sorted(atm_dct)}
+        bnd_dct = {key: bnd_dct[key] for key in sorted(bnd_dct)}
+        return _from_atoms_and_bonds(atoms=atm_dct, bonds=bnd_dct)
+
     atm_sym_dct = dict_.transform_values(atm_dct, lambda x: x[0])
     atm_imp_hyd_vlc_dct = dict_.transform_values(atm_dct, lambda x: x[1])
     atm_ste_par_dct = dict_.transform_values(atm_dct, lambda x: x[2])
@@ -152,6 +160,22 @@ def from_atoms_and_bonds(atoms, bonds):
         bond_stereo_parities=bnd_ste_par_dct)
 
 
+def _conforming(atm_dct, bnd_dct):
+    """ do these dictionaries already conform to the validated graph format?
+    """
+    atms_ok = all(
+        isinstance(row, tuple) and len(row) == 3 and
+        isinstance(row[0], str) and pt.to_E(row[0]) == row[0] and
+        isinstance(row[1], int) and row[2] in (None, True, False)
+        for row in atm_dct.values())
+    bnds_ok = atms_ok and all(
+        isinstance(key, frozenset) and len(key) == 2 and
+        isinstance(row, tuple) and len(row) == 2 and
+        isinstance(row[0], int) and row[1] in (None, True, False)
+        for key, row in bnd_dct.items())
+    return bnds_ok
+
+
 def _from_atoms_and_bonds(atoms, bonds):
     """ construct a molecular graph from atom and bond dictionaries
 
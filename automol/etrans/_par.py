@@ -18,10 +18,6 @@ def read_lj_dct(bath, target):
     """ Read the LJ_DCT
     """
 
-    print('lj dct')
-    print('bath', bath)
-    print('target', target)
-
     bath_dct = LJ_EST_DCT.get(bath, None)
     if bath_dct is not None:
         lj_params = bath_dct.get(target, None)
@@ -42,29 +42,30 @@ def from_subset(geo, idxs):
 def symbols(geo, idxs=None):
     """ atomic symbols
     """
-    idxs = list(range(count(geo))) if idxs is None else idxs
-
     if geo:
         syms, _ = zip(*geo)
     else:
         syms = ()
 
-    syms = tuple(sym for idx, sym in enumerate(syms) if idx in idxs)
-    return syms
+    if idxs is not None:
+        idxs = set(idxs)
+        syms = tuple(sym for idx, sym in enumerate(syms) if idx in idxs)
+    return tuple(syms)
 
 
 def coordinates(geo, idxs=None, angstrom=False):
     """ atomic coordinates
     """
-    idxs = list(range(count(geo))) if idxs is None else idxs
     if geo:
         _, xyzs = zip(*geo)
     else:
         xyzs = ()
     xyzs = xyzs if not angstrom else numpy.multiply(
         xyzs, qcc.conversion_factor('bohr', 'angstrom'))
-    xyzs = tuple(xyz for idx, xyz in enumerate(xyzs) if idx in idxs)
-    return xyzs
+    if idxs is not None:
+        idxs = set(idxs)
+        xyzs = tuple(xyz for idx, xyz in enumerate(xyzs) if idx in idxs)
+    return tuple(xyzs)
 
 
 def count(geo):
@@ -85,14 +86,14 @@ def atom_indices(geo, sym, match=True):
     """
 
     syms = symbols(geo)
-    idxs = tuple()
+    idxs = []
     for idx, sym_ in enumerate(syms):
         if sym_ == sym and match:
-            idxs += (idx,)
+            idxs.append(idx)
         elif sym_ != sym and not match:
-            idxs += (idx,)
+            idxs.append(idx)
 
-    return idxs
+    return tuple(idxs)
 
 
 def dummy_atom_indices(geo):
@@ -214,6 +215,7 @@ def formula(geo):
 def remove(geo, idxs=()):
     """ Remove idxs from a geometry
     """
+    idxs = set(idxs)
     new_geo = tuple(row for i, row in enumerate(geo) if i not in idxs)
     return new_geo
 
@@ -227,7 +229,7 @@ def end_group_sym_factor(geo, frm_bnd_keys=(), brk_bnd_keys=()):
 
     gra = graph(geo, remove_stereo=True)
     term_atms = {}
-    all_hyds = []
+    all_hyds = set()
     neighbor_dct = automol.graph.atom_neighbor_keys(gra)
 
     # determine if atom is a part of a double bond
@@ -235,14 +237,14 @@ def end_group_sym_factor(geo, frm_bnd_keys=(), brk_bnd_keys=()):
     if not saddle:
         rad_atms = automol.graph.sing_res_dom_radical_atom_keys(gra)
         res_rad_atms = automol.graph.resonance_dominant_radical_atom_keys(gra)
-        rad_atms = [atm for atm in rad_atms if atm not in res_rad_atms]
+        rad_atms = {atm for atm in rad_atms if atm not in res_rad_atms}
     else:
-        rad_atms = []
+        rad_atms = set()
 
     gra = gra[0]
     for atm in gra:
         if gra[atm][0] == 'H':
-            all_hyds.append(atm)
+            all_hyds.add(atm)
     for atm in gra:
         if atm in unsat_atms and atm not in rad_atms:
             pass
@@ -369,12 +371,12 @@ def from_xyz_trajectory_string(geo_str):
     line1 = geo_lines[0].strip()
     natoms = int(line1)
 
-    geoms, comments = tuple(), tuple()
+    geoms, comments = [], []
     for block in _blocks(geo_lines, natoms+2):
-        comments += (block[1],)
-        geoms += (from_string('\n'.join(block[2:])),)
+        comments.append(block[1])
+        geoms.append(from_string('\n'.join(block[2:])))
 
-    return (geoms, comments)
+    return (tuple(geoms), tuple(comments))
 
 
 # representations
@@ -614,7 +616,7 @@ def rot_permutated_geoms(geo, frm_bnd_keys=(), brk_bnd_keys=()):
 
     gra = graph(geo, remove_stereo=True)
     term_atms = {}
-    all_hyds = []
+    all_hyds = set()
     neighbor_dct = automol.graph.atom_neighbor_keys(gra)
 
     # determine if atom is a part of a double bond
@@ -622,14 +624,14 @@ def rot_permutated_geoms(geo, frm_bnd_keys=(), brk_bnd_keys=()):
     if not saddle:
         rad_atms = automol.graph.sing_res_dom_radical_atom_keys(gra)
         res_rad_atms = automol.graph.resonance_dominant_radical_atom_keys(gra)
-        rad_atms = [atm for atm in rad_atms if atm not in res_rad_atms]
+        rad_atms = {atm for atm in rad_atms if atm not in res_rad_atms}
     else:
-        rad_atms = []
+        rad_atms = set()
 
     gra = gra[0]
     for atm in gra:
         if gra[atm][0] == 'H':
-            all_hyds.append(atm)
+            all_hyds.add(atm)
     for atm in gra:
         if atm in unsat_atms and atm not in rad_atms:
             pass
@@ -716,23 +718,19 @@ def dihedral_angle(geo, idx1, idx2, idx3, idx4, degree=False):
 def distance_matrix(geo):
     """form distance matrix for a set of xyz coordinates
     """
-    mat = numpy.zeros((len(geo), len(geo)))
-    for i in range(len(geo)):
-        for j in range(len(geo)):
-            mat[i][j] = distance(geo, i, j)
+    xyzs = numpy.array(coordinates(geo), dtype=float).reshape(len(geo), 3)
+    diffs = xyzs[:, numpy.newaxis, :] - xyzs[numpy.newaxis, :, :]
+    mat = numpy.sqrt(numpy.sum(numpy.square(diffs), axis=-1))
     return mat
 
 
 def almost_equal_dist_matrix(geo1, geo2, thresh=0.1):
     """form distance matrix for a set of xyz coordinates
     """
-    for i in range(len(geo1)):
-        for j in range(len(geo1)):
-            dist_mat1_ij = distance(geo1, i, j)
-            dist_mat2_ij = distance(geo2, i, j)
-            if abs(dist_mat1_ij - dist_mat2_ij) > thresh:
-                return False
-    return True
+    dist_mat1 = distance_matrix(geo1)
+    dist_mat2 = distance_matrix(geo2)
+    return bool(numpy.amax(numpy.abs(dist_mat1 - dist_mat2),
+                           initial=0.) <= thresh)
 
 
 def external_symmetry_factor(geo):
@@ -922,11 +920,9 @@ def total_mass(geo):
 def center_of_mass(geo):
     """ center of mass
     """
-    xyzs = coordinates(geo)
-    amas = masses(geo)
-    cm_xyz = tuple(
-        sum(numpy.multiply(xyz, ama) for xyz, ama in zip(xyzs, amas)) /
-        sum(amas))
+    xyzs = numpy.array(coordinates(geo))
+    amas = numpy.array(masses(geo))
+    cm_xyz = tuple(numpy.dot(amas, xyzs) / numpy.sum(amas))
 
     return cm_xyz
 
@@ -959,11 +955,12 @@ def inertia_tensor(geo, amu=True):
     """ molecula# r inertia tensor (atomic units if amu=False)
     """
     geo = mass_centered(geo)
-    amas = masses(geo, amu=amu)
-    xyzs = coordinates(geo)
-    ine = tuple(map(tuple, sum(
-        ama * (numpy.vdot(xyz, xyz) * numpy.eye(3) - numpy.outer(xyz, xyz))
-        for ama, xyz in zip(amas, xyzs))))
+    amas = numpy.array(masses(geo, amu=amu))
+    xyzs = numpy.array(coordinates(geo))
+    # vectorized form of sum_i m_i * (|r_i|^2 * I - r_i (x) r_i)
+    wxyzs = amas[:, numpy.newaxis] * xyzs
+    ine = tuple(map(tuple, (numpy.sum(wxyzs * xyzs) * numpy.eye(3) -
+                            numpy.dot(wxyzs.T, xyzs))))
 
     return ine
 
@@ -1013,6 +1010,7 @@ def is_linear(geo, tol=2.*qcc.conversion_factor('degree', 'radian')):
             if not (numpy.abs(cangle) < tol or
                     numpy.abs(cangle - numpy.pi) < tol):
                 ret = False
+                break
     return ret
 
 
@@ -9,6 +9,7 @@ from automol.graph._ring import rings
 from automol.graph._graph import atom_neighbor_keys
 from automol.graph._graph import remove_atoms
 from automol.graph._graph import full_isomorphism
+from automol.graph._graph import frozen
 from automol.graph._res import dominant_resonance
 from automol.graph._res import resonance_dominant_radical_atom_keys
 from automol.graph._res import bond_orders
@@ -406,12 +407,29 @@ def bonds_of_type(gra, asymb1='C', asymb2='C', mbond=1):
     return _bonds_of_type
 
 
+_DOMINANT_RESONANCE_CACHE = {}
+
+
+def _cached_dominant_resonance(gra):
+    """ dominant resonance of a graph
+
+        (cached, since the functional group finders rebuild the same
+        resonance graph several times when scanning one molecule)
+    """
+    key = frozen(gra)
+    if key not in _DOMINANT_RESONANCE_CACHE:
+        if len(_DOMINANT_RESONANCE_CACHE) > 100:
+            _DOMINANT_RESONANCE_CACHE.clear()
+        _DOMINANT_RESONANCE_CACHE[key] = dominant_resonance(gra)
+    return _DOMINANT_RESONANCE_CACHE[key]
+
+
 def bonds_of_order(gra, mbond=1):
     """ Determine the indices of a certain
     """
 
     # Build resonance graph to get the bond orders
-    gra = dominant_resonance(gra)
+    gra = _cached_dominant_resonance(gra)
     bond_order_dct = bond_orders(gra)
 
     mbond_idxs = tuple()
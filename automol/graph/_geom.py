@@ -1,6 +1,5 @@
 """ stereo graph library
 """
-import itertools
 import more_itertools as mit
 import numpy
 from qcelemental import constants as qcc
@@ -158,6 +157,10 @@ def set_stereo_from_geometry(gra, geo, geo_idx_dct=None):
     geo_idx_dct = (geo_idx_dct if geo_idx_dct is not None
                    else {atm_key: idx for idx, atm_key in enumerate(atm_keys)})
 
+    # the connectivity is fixed through the iteration below, which only
+    # changes parities, so the neighbor keys can be computed once up front
+    atm_ngb_keys_dct = atom_neighbor_keys(gra)
+
     # set atom and bond stereo, iterating to self-consistency
     atm_keys = set()
     bnd_keys = set()
@@ -165,37 +168,56 @@ def set_stereo_from_geometry(gra, geo, geo_idx_dct=None):
         last_gra = gra
         atm_keys.update(stereogenic_atom_keys(gra))
         bnd_keys.update(stereogenic_bond_keys(gra))
-        gra = _set_atom_stereo_from_geometry(gra, atm_keys, geo, geo_idx_dct)
-        gra = _set_bond_stereo_from_geometry(gra, bnd_keys, geo, geo_idx_dct)
+        gra = _set_atom_stereo_from_geometry(
+            gra, atm_keys, geo, geo_idx_dct, atm_ngb_keys_dct)
+        gra = _set_bond_stereo_from_geometry(
+            gra, bnd_keys, geo, geo_idx_dct, atm_ngb_keys_dct)
 
     return gra
 
 
-def _set_atom_stereo_from_geometry(gra, atm_keys, geo, geo_idx_dct):
+def _set_atom_stereo_from_geometry(gra, atm_keys, geo, geo_idx_dct,
+                                   atm_ngb_keys_dct=None):
     assert gra == explicit(gra)
 
+    if atm_ngb_keys_dct is None:
+        atm_ngb_keys_dct = atom_neighbor_keys(gra)
+
     atm_pars = [
-        _atom_stereo_parity_from_geometry(gra, atm_key, geo, geo_idx_dct)
+        _atom_stereo_parity_from_geometry(
+            gra, atm_key, geo, geo_idx_dct,
+            atm_ngb_keys_dct=atm_ngb_keys_dct)
         for atm_key in atm_keys]
     gra = set_atom_stereo_parities(gra, dict(zip(atm_keys, atm_pars)))
     return gra
 
 
-def _set_bond_stereo_from_geometry(gra, bnd_keys, geo, geo_idx_dct):
+def _set_bond_stereo_from_geometry(gra, bnd_keys, geo, geo_idx_dct,
+                                   atm_ngb_keys_dct=None):
     assert gra == explicit(gra)
 
+    if atm_ngb_keys_dct is None:
+        atm_ngb_keys_dct = atom_neighbor_keys(gra)
+
     bnd_pars = [
-        _bond_stereo_parity_from_geometry(gra, bnd_key, geo, geo_idx_dct)
+        _bond_stereo_parity_from_geometry(
+            gra, bnd_key, geo, geo_idx_dct,
+            atm_ngb_keys_dct=atm_ngb_keys_dct)
         for bnd_key in bnd_keys]
     gra = set_bond_stereo_parities(gra, dict(zip(bnd_keys, bnd_pars)))
     return gra
 
 
 # stereo parity evaluation code
-def _atom_stereo_parity_from_geometry(gra, atm_key, geo, geo_idx_dct):
+def _atom_stereo_parity_from_geometry(gra, atm_key, geo, geo_idx_dct,
+                                      atm_ngb_keys_dct=None):
     """ get the current stereo parity of an atom from its geometry
+
+    (the neighbor keys dictionary may be passed in to avoid rebuilding it
+    when looping over atoms of the same graph)
     """
-    atm_ngb_keys_dct = atom_neighbor_keys(gra)
+    if atm_ngb_keys_dct is None:
+        atm_ngb_keys_dct = atom_neighbor_keys(gra)
     atm_ngb_keys = atm_ngb_keys_dct[atm_key]
 
     # sort the neighbor keys by stereo priority
@@ -214,11 +236,16 @@ def _atom_stereo_parity_from_geometry(gra, atm_key, geo, geo_idx_dct):
     return par
 
 
-def _bond_stereo_parity_from_geometry(gra, bnd_key, geo, geo_idx_dct):
+def _bond_stereo_parity_from_geometry(gra, bnd_key, geo, geo_idx_dct,
+                                      atm_ngb_keys_dct=None):
     """ get the current stereo parity of a bond from its geometry
+
+    (the neighbor keys dictionary may be passed in to avoid rebuilding it
+    when looping over bonds of the same graph)
     """
     atm1_key, atm2_key = bnd_key
-    atm_ngb_keys_dct = atom_neighbor_keys(gra)
+    if atm_ngb_keys_dct is None:
+        atm_ngb_keys_dct = atom_neighbor_keys(gra)
     atm1_ngb_keys = atm_ngb_keys_dct[atm1_key] - {atm2_key}
     atm2_ngb_keys = atm_ngb_keys_dct[atm2_key] - {atm1_key}
 
@@ -284,14 +311,15 @@ def _stereo_corrected_geometry(sgr, geo, geo_idx_dct):
 def _atom_stereo_corrected_geometry(gra, atm_ste_par_dct, geo, geo_idx_dct):
     """ correct the atom stereo parities of a geometry, for a subset of atoms
     """
-    ring_atm_keys = set(itertools.chain(*rings_atom_keys(gra)))
+    ring_atm_keys = set().union(*rings_atom_keys(gra))
     atm_ngb_keys_dct = atom_neighbor_keys(gra)
 
     atm_keys = list(atm_ste_par_dct.keys())
     for atm_key in atm_keys:
         par = atm_ste_par_dct[atm_key]
         curr_par = _atom_stereo_parity_from_geometry(
-            gra, atm_key, geo, geo_idx_dct)
+            gra, atm_key, geo, geo_idx_dct,
+            atm_ngb_keys_dct=atm_ngb_keys_dct)
 
         if curr_par != par:
             atm_ngb_keys = atm_ngb_keys_dct[atm_key]
@@ -319,8 +347,11 @@ def _atom_stereo_corrected_geometry(gra, atm_ste_par_dct, geo, geo_idx_dct):
             geo = automol.geom.rotate(
                 geo, rot_axis, numpy.pi, orig_xyz=atm_xyz, idxs=rot_idxs)
 
-        assert _atom_stereo_parity_from_geometry(
-            gra, atm_key, geo, geo_idx_dct) == par
+            # only re-evaluate the parity if the geometry was rotated
+            assert _atom_stereo_parity_from_geometry(
+                gra, atm_key, geo, geo_idx_dct,
+                atm_ngb_keys_dct=atm_ngb_keys_dct) == par
+
         gra = set_atom_stereo_parities(gra, {atm_key: par})
 
     return geo, gra
@@ -329,11 +360,14 @@ def _atom_stereo_corrected_geometry(gra, atm_ste_par_dct, geo, geo_idx_dct):
 def _bond_stereo_corrected_geometry(gra, bnd_ste_par_dct, geo, geo_idx_dct):
     """ correct the bond stereo parities of a geometry, for a subset of bonds
     """
+    atm_ngb_keys_dct = atom_neighbor_keys(gra)
+
     bnd_keys = list(bnd_ste_par_dct.keys())
     for bnd_key in bnd_keys:
         par = bnd_ste_par_dct[bnd_key]
         curr_par = _bond_stereo_parity_from_geometry(
-            gra, bnd_key, geo, geo_idx_dct)
+            gra, bnd_key, geo, geo_idx_dct,
+            atm_ngb_keys_dct=atm_ngb_keys_dct)
 
         if curr_par != par:
             xyzs = automol.geom.coordinates(geo)
@@ -352,8 +386,11 @@ def _bond_stereo_corrected_geometry(gra, bnd_ste_par_dct, geo, geo_idx_dct):
             geo = automol.geom.rotate(
                 geo, rot_axis, numpy.pi, orig_xyz=atm1_xyz, idxs=rot_idxs)
 
-        assert _bond_stereo_parity_from_geometry(
-            gra, bnd_key, geo, geo_idx_dct) == par
+            # only re-evaluate the parity if the geometry was rotated
+            assert _bond_stereo_parity_from_geometry(
+                gra, bnd_key, geo, geo_idx_dct,
+                atm_ngb_keys_dct=atm_ngb_keys_dct) == par
+
         gra = set_bond_stereo_parities(gra, {bnd_key: par})
 
     return geo, gra
@@ -185,8 +185,6 @@ def ring_system_zmatrix(gra, ring_system_decomp_keys):
     ring_sys_iter = iter(ring_system_decomp_keys)
 
     ring_keys = next(ring_sys_iter)
-    print(automol.graph.string(gra))
-    print(ring_keys)
 
     zma, ring_rows = ring_zmatrix(gra, ring_keys)
     row_dct = dict(zip(ring_keys, ring_rows))
@@ -195,8 +193,6 @@ def ring_system_zmatrix(gra, ring_system_decomp_keys):
     end_keys = (arc_keys[0], arc_keys[-1])
     end_rows = list(map(row_dct.__getitem__, end_keys))
     end_dist = automol.zmat.distance(zma, *end_rows, angstrom=True)
-    print(end_keys)
-    print(end_dist)
     arc_zma, arc_rows = ring_zmatrix(gra, arc_keys, end_dist=end_dist)
     # arc_row_dct = dict(zip(arc_keys, arc_rows))
 
@@ -214,10 +210,6 @@ def ring_system_zmatrix(gra, ring_system_decomp_keys):
     val_mat = [[ang1, dih1], [dih2]]
     zma = automol.zmat.join_replace_one(zma, arc_zma, row3, row_mat, val_mat)
 
-    geo = automol.zmat.geometry(zma)
-    print(automol.zmat.string(zma))
-    print(automol.geom.string(geo))
-
 
 def ring_zmatrix(gra, ring_keys, bond_dist=XY_DIST, end_dist=XY_DIST):
     """ z-matrix for a ring (or arc) of heavy atoms
@@ -1,6 +1,5 @@
 """ molecular graph
 """
-import itertools
 import functools
 import numpy
 import future.moves.itertools as fmit
@@ -78,8 +77,8 @@ def without_bond_orders(gra):
 def without_stereo_parities(gra):
     """ graph with stereo assignments wiped out
     """
-    atm_ste_par_dct = dict_.by_key({}, atom_keys(gra), fill_val=None)
-    bnd_ste_par_dct = dict_.by_key({}, bond_keys(gra), fill_val=None)
+    atm_ste_par_dct = dict.fromkeys(atom_keys(gra), None)
+    bnd_ste_par_dct = dict.fromkeys(bond_keys(gra), None)
     gra = set_atom_stereo_parities(gra, atm_ste_par_dct)
     gra = set_bond_stereo_parities(gra, bnd_ste_par_dct)
     return gra
@@ -88,17 +87,19 @@ def without_stereo_parities(gra):
 def frozen(gra):
     """ hashable, sortable, immutable container of graph data
     """
-    atm_keys = sorted(atom_keys(gra))
-    bnd_keys = sorted(bond_keys(gra), key=sorted)
+    atm_dct = atoms(gra)
+    bnd_dct = bonds(gra)
+    atm_keys = sorted(atm_dct)
+    bnd_keys = sorted(bnd_dct, key=sorted)
 
     # make it sortable by replacing Nones with -infinity
-    atm_vals = numpy.array(dict_.values_by_key(atoms(gra), atm_keys))
-    bnd_vals = numpy.array(dict_.values_by_key(bonds(gra), bnd_keys))
-    atm_vals[numpy.equal(atm_vals, None)] = -numpy.inf
-    bnd_vals[numpy.equal(bnd_vals, None)] = -numpy.inf
-
-    frz_atms = tuple(zip(atm_keys, map(tuple, atm_vals)))
-    frz_bnds = tuple(zip(bnd_keys, map(tuple, bnd_vals)))
+    ninf = -numpy.inf
+    frz_atms = tuple(
+        (key, tuple(ninf if val is None else val for val in atm_dct[key]))
+        for key in atm_keys)
+    frz_bnds = tuple(
+        (key, tuple(ninf if val is None else val for val in bnd_dct[key]))
+        for key in bnd_keys)
     return (frz_atms, frz_bnds)
 
 
@@ -201,7 +202,10 @@ def bond_neighborhoods(gra):
     bnd_keys = list(bond_keys(gra))
 
     def _neighborhood(bnd_key):
-        nbh_bnd_keys = set(filter(lambda x: bnd_key & x, bnd_keys))
+        # isdisjoint stops at the first shared atom without allocating an
+        # intersection set for every pair of bonds
+        nbh_bnd_keys = set(bnd_key_ for bnd_key_ in bnd_keys
+                           if not bnd_key.isdisjoint(bnd_key_))
         return bond_induced_subgraph(gra, nbh_bnd_keys)
 
     bnd_nbh_dct = dict(zip(bnd_keys, map(_neighborhood, bnd_keys)))
@@ -232,7 +236,12 @@ def branch_bond_keys(gra, atm_key, bnd_key):
     bnd_key = frozenset(bnd_key)
     assert atm_key in bnd_key
 
-    atm_bnd_keys_dct = atom_bond_keys(gra)
+    # local adjacency map of bond keys by atom (much cheaper than building
+    # the full neighborhood subgraphs for every bond in the graph)
+    atm_bnd_keys_dct = {}
+    for key in bond_keys(gra):
+        for atm in key:
+            atm_bnd_keys_dct.setdefault(atm, set()).add(key)
 
     bnch_bnd_keys = {bnd_key}
     seen_bnd_keys = set()
@@ -240,12 +249,11 @@ def branch_bond_keys(gra, atm_key, bnd_key):
 
     new_bnd_keys = {bnd_key}
 
-    bnd_ngb_keys_dct = bond_neighbor_keys(gra)
-
     while new_bnd_keys:
-        new_bnd_ngb_keys = set(
-            itertools.chain(
-                *dict_.values_by_key(bnd_ngb_keys_dct, new_bnd_keys)))
+        new_bnd_ngb_keys = set()
+        for new_bnd_key in new_bnd_keys:
+            for atm in new_bnd_key:
+                new_bnd_ngb_keys.update(atm_bnd_keys_dct[atm])
         bnch_bnd_keys.update(new_bnd_ngb_keys - excl_bnd_keys)
         seen_bnd_keys.update(new_bnd_keys)
         new_bnd_keys = bnch_bnd_keys - seen_bnd_keys
@@ -351,7 +359,7 @@ def subgraph(gra, atm_keys):
 def bond_induced_subgraph(gra, bnd_keys):
     """ the subgraph induced by a subset of the bonds
     """
-    atm_keys = set(itertools.chain(*bnd_keys))
+    atm_keys = set().union(*bnd_keys)
     bnd_keys = set(bnd_keys)
     assert atm_keys <= atom_keys(gra)
     atm_dct = dict_.by_key(atoms(gra), atm_keys)
@@ -452,7 +460,9 @@ def add_bonds(gra, keys, ord_dct=None, ste_par_dct=None, check=True):
     bnd_ord_dct = bond_orders(gra)
     bnd_ste_par_dct = bond_stereo_parities(gra)
 
-    keys = set(map(frozenset, keys))
+    # skip the wrap for keys that are already frozensets
+    keys = {key if isinstance(key, frozenset) else frozenset(key)
+            for key in keys}
     ord_dct = {} if ord_dct is None else ord_dct
     ste_par_dct = {} if ste_par_dct is None else ste_par_dct
 
@@ -495,7 +505,8 @@ def remove_bonds(gra, bnd_keys, check=True):
     """ remove bonds from the molecular graph
     """
     all_bnd_keys = bond_keys(gra)
-    bnd_keys = set(map(frozenset, bnd_keys))
+    bnd_keys = {key if isinstance(key, frozenset) else frozenset(key)
+                for key in bnd_keys}
 
     if check:
         assert bnd_keys <= all_bnd_keys
@@ -634,7 +645,7 @@ def add_atom_explicit_hydrogen_keys(gra, atm_exp_hyd_keys_dct):
         assert not set(atm_exp_hyd_keys) & atom_keys(gra)
         atm_exp_hyd_bnd_keys = {frozenset({atm_key, atm_exp_hyd_key})
                                 for atm_exp_hyd_key in atm_exp_hyd_keys}
-        atm_exp_hyd_sym_dct = dict_.by_key({}, atm_exp_hyd_keys, fill_val='H')
+        atm_exp_hyd_sym_dct = dict.fromkeys(atm_exp_hyd_keys, 'H')
         gra = add_atoms(gra, atm_exp_hyd_sym_dct)
         gra = add_bonds(gra, atm_exp_hyd_bnd_keys)
     return gra
@@ -651,7 +662,7 @@ def implicit(gra, atm_keys=None):
     inc_imp_hyd_keys_dct = dict_.transform_values(atm_exp_hyd_keys_dct, len)
     gra = add_atom_implicit_hydrogen_valences(gra, inc_imp_hyd_keys_dct)
 
-    exp_hyd_keys = set(itertools.chain(*atm_exp_hyd_keys_dct.values()))
+    exp_hyd_keys = set().union(*atm_exp_hyd_keys_dct.values())
     gra = remove_atoms(gra, exp_hyd_keys)
     return gra
 
@@ -664,16 +675,21 @@ def explicit(gra, atm_keys=None):
     atm_imp_hyd_vlc_dct = dict_.by_key(
         atom_implicit_hydrogen_valences(gra), atm_keys)
 
+    # nothing to do if there are no implicit hydrogens at these atoms
+    if not any(atm_imp_hyd_vlc_dct.values()):
+        return gra
+
     atm_exp_hyd_keys_dct = {}
     next_atm_key = max(atom_keys(gra)) + 1
     for atm_key in atm_keys:
         imp_hyd_vlc = atm_imp_hyd_vlc_dct[atm_key]
-        atm_exp_hyd_keys_dct[atm_key] = set(
-            range(next_atm_key, next_atm_key+imp_hyd_vlc))
-        next_atm_key += imp_hyd_vlc
+        if imp_hyd_vlc:
+            atm_exp_hyd_keys_dct[atm_key] = set(
+                range(next_atm_key, next_atm_key+imp_hyd_vlc))
+            next_atm_key += imp_hyd_vlc
 
     gra = set_atom_implicit_hydrogen_valences(
-        gra, dict_.by_key({}, atm_keys, fill_val=0))
+        gra, dict.fromkeys(atm_keys, 0))
     gra = add_atom_explicit_hydrogen_keys(gra, atm_exp_hyd_keys_dct)
     return gra
 
@@ -768,9 +784,10 @@ def atom_element_valences(gra):
     """ element valences (# possible single bonds), by atom
     """
     atm_sym_dct = atom_symbols(gra)
-    atm_group_idx_dct = dict_.transform_values(atm_sym_dct, pt.to_group)
-    atm_elem_vlc_dct = dict_.transform_values(atm_group_idx_dct,
-                                              VALENCE_DCT.__getitem__)
+    # build the dictionary in a single pass rather than through intermediate
+    # transform_values copies
+    atm_elem_vlc_dct = {atm_key: VALENCE_DCT[pt.to_group(sym)]
+                        for atm_key, sym in atm_sym_dct.items()}
     return atm_elem_vlc_dct
 
 
@@ -778,10 +795,8 @@ def atom_lone_pair_counts(gra):
     """ lone pair counts, by atom
     """
     atm_sym_dct = atom_symbols(gra)
-    atm_group_idx_dct = dict_.transform_values(atm_sym_dct, pt.to_group)
-    atm_lpc_dct = dict_.transform_values(atm_group_idx_dct,
-                                         LONE_PAIR_COUNTS_DCT.__getitem__)
-    atm_lpc_dct = dict_.transform_values(atm_lpc_dct, int)
+    atm_lpc_dct = {atm_key: int(LONE_PAIR_COUNTS_DCT[pt.to_group(sym)])
+                   for atm_key, sym in atm_sym_dct.items()}
     return atm_lpc_dct
 
 
@@ -794,9 +809,8 @@ def atom_bond_valences(gra, bond_order=True):
         gra = without_bond_orders(gra)
 
     atm_nbhs = dict_.values_by_key(atom_neighborhoods(gra), atm_keys)
-    atm_bnd_vlcs = [sum(bond_orders(nbh).values()) for nbh in atm_nbhs]
-    atm_bnd_vlc_dct = dict_.transform_values(
-        dict(zip(atm_keys, atm_bnd_vlcs)), int)
+    atm_bnd_vlc_dct = {atm_key: int(sum(bond_orders(nbh).values()))
+                       for atm_key, nbh in zip(atm_keys, atm_nbhs)}
     return atm_bnd_vlc_dct
 
 
@@ -812,8 +826,8 @@ def atom_unsaturated_valences(gra, bond_order=True):
     atm_bnd_vlcs = dict_.values_by_key(atom_bond_valences(gra), atm_keys)
     atm_tot_vlcs = dict_.values_by_key(atom_element_valences(gra), atm_keys)
     atm_rad_vlcs = numpy.subtract(atm_tot_vlcs, atm_bnd_vlcs)
-    atm_unsat_vlc_dct = dict_.transform_values(
-        dict(zip(atm_keys, atm_rad_vlcs)), int)
+    atm_unsat_vlc_dct = {atm_key: int(vlc)
+                         for atm_key, vlc in zip(atm_keys, atm_rad_vlcs)}
     return atm_unsat_vlc_dct
 
 
@@ -271,9 +271,12 @@ def dominant_resonances(rgr):
     """ all dominant (minimum spin/maximum pi) resonance graphs
     """
     rgrs = resonances(rgr)
-    mult_min = min(map(maximum_spin_multiplicity, rgrs))
+    # compute the multiplicity of each resonance once, rather than once for
+    # the minimum and again for the filter
+    mults = tuple(map(maximum_spin_multiplicity, rgrs))
+    mult_min = min(mults)
     dom_rgrs = tuple(
-        rgr for rgr in rgrs if maximum_spin_multiplicity(rgr) == mult_min)
+        rgr for rgr, mult in zip(rgrs, mults) if mult == mult_min)
     return dom_rgrs
 
 
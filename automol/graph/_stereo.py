@@ -27,7 +27,11 @@ from automol.graph._graph import explicit_hydrogen_keys
 def has_stereo(gra):
     """ does this graph have stereo of any kind?
     """
-    return bool(atom_stereo_keys(gra) or bond_stereo_keys(gra))
+    # scan the parities directly, stopping at the first assignment, rather
+    # than building both full stereo key sets
+    return (
+        any(par is not None for par in atom_stereo_parities(gra).values()) or
+        any(par is not None for par in bond_stereo_parities(gra).values()))
 
 
 def atom_stereo_keys(sgr):
@@ -50,23 +54,58 @@ def stereo_priority_vector(gra, atm_key, atm_ngb_key):
     """ generates a sortable one-to-one representation of the branch extending
     from `atm_key` through its bonded neighbor `atm_ngb_key`
     """
+    return _stereo_priority_vector(_priority_info(gra), atm_key, atm_ngb_key)
+
+
+def _priority_info(gra):
+    """ gather the graph information needed for priority vectors
+
+    (so that callers evaluating many priority vectors on the same graph only
+    gather it once)
+    """
     bbn_keys = backbone_keys(gra)
     exp_hyd_keys = explicit_hydrogen_keys(gra)
+    exp_bnd_dct = bonds(gra)
+
+    # here, switch to an implicit graph
+    gra = implicit(gra)
+    atm_dct = atoms(gra)
+    bnd_dct = bonds(gra)
+    atm_ngb_keys_dct = atom_neighbor_keys(gra)
+
+    return (bbn_keys, exp_hyd_keys, exp_bnd_dct,
+            atm_dct, bnd_dct, atm_ngb_keys_dct)
+
+
+_PRIORITY_INFO_CACHE = {}
+
+
+def _cached_priority_info(gra):
+    """ priority-vector information, cached by graph
+
+    (for callers that pass the same graph in one call per atom or bond,
+    such as the geometry parity evaluators)
+    """
+    key = frozen(gra)
+    if key not in _PRIORITY_INFO_CACHE:
+        if len(_PRIORITY_INFO_CACHE) > 100:
+            _PRIORITY_INFO_CACHE.clear()
+        _PRIORITY_INFO_CACHE[key] = _priority_info(gra)
+    return _PRIORITY_INFO_CACHE[key]
+
+
+def _stereo_priority_vector(pri_info, atm_key, atm_ngb_key):
+    (bbn_keys, exp_hyd_keys, exp_bnd_dct,
+     atm_dct, bnd_dct, atm_ngb_keys_dct) = pri_info
 
     if atm_ngb_key not in bbn_keys:
         assert atm_ngb_key in exp_hyd_keys
-        assert frozenset({atm_key, atm_ngb_key}) in bonds(gra)
+        assert frozenset({atm_key, atm_ngb_key}) in exp_bnd_dct
         pri_vec = ()
     else:
-        gra = implicit(gra)
-        atm_dct = atoms(gra)
-        bnd_dct = bonds(gra)
         assert atm_key in bbn_keys
         assert frozenset({atm_key, atm_ngb_key}) in bnd_dct
 
-        # here, switch to an implicit graph
-        atm_ngb_keys_dct = atom_neighbor_keys(gra)
-
         def _priority_vector(atm1_key, atm2_key, seen_keys):
             # we keep a list of seen keys to cut off cycles, avoiding infinite
             # loops
@@ -110,10 +149,11 @@ def stereogenic_atom_keys(gra):
     atm_keys -= atom_stereo_keys(gra)
 
     atm_ngb_keys_dct = atom_neighbor_keys(gra)
+    pri_info = _priority_info(gra)
 
     def _is_stereogenic(atm_key):
         atm_ngb_keys = list(atm_ngb_keys_dct[atm_key])
-        pri_vecs = [stereo_priority_vector(gra, atm_key, atm_ngb_key)
+        pri_vecs = [_stereo_priority_vector(pri_info, atm_key, atm_ngb_key)
                     for atm_ngb_key in atm_ngb_keys]
         return not any(pv1 == pv2
                        for pv1, pv2 in itertools.combinations(pri_vecs, r=2))
@@ -142,6 +182,7 @@ def stereogenic_bond_keys(gra):
         filter(lambda x: len(x) < 8, rings_bond_keys(gra)), frozenset())
 
     atm_ngb_keys_dct = atom_neighbor_keys(gra)
+    pri_info = _priority_info(gra)
 
     def _is_stereogenic(bnd_key):
         atm1_key, atm2_key = bnd_key
@@ -155,8 +196,10 @@ def stereogenic_bond_keys(gra):
                 ret = False
             else:
                 assert len(atm_ngb_keys) == 2   # C=C(-X)-Y
-                ret = (stereo_priority_vector(gra, atm_key, atm_ngb_keys[0]) ==
-                       stereo_priority_vector(gra, atm_key, atm_ngb_keys[1]))
+                ret = (_stereo_priority_vector(
+                    pri_info, atm_key, atm_ngb_keys[0]) ==
+                       _stereo_priority_vector(
+                    pri_info, atm_key, atm_ngb_keys[1]))
 
             return ret
 
@@ -170,35 +213,36 @@ def stereogenic_bond_keys(gra):
 def stereomers(gra):
     """ all stereomers, ignoring this graph's assignments
     """
-    bool_vals = (False, True)
+    return tuple(sorted(_stereomers_iter(without_stereo_parities(gra)),
+                        key=frozen))
+
 
-    def _expand_atom_stereo(sgr):
-        atm_ste_keys = stereogenic_atom_keys(sgr)
-        nste_atms = len(atm_ste_keys)
-        sgrs = [set_atom_stereo_parities(sgr, dict(zip(atm_ste_keys,
-                                                       atm_ste_par_vals)))
-                for atm_ste_par_vals
-                in itertools.product(bool_vals, repeat=nste_atms)]
-        return sgrs
+def _stereomers_iter(sgr):
+    """ iterate over the stereomers of a graph
 
-    def _expand_bond_stereo(sgr):
-        bnd_ste_keys = stereogenic_bond_keys(sgr)
-        nste_bnds = len(bnd_ste_keys)
-        sgrs = [set_bond_stereo_parities(sgr, dict(zip(bnd_ste_keys,
-                                                       bnd_ste_par_vals)))
-                for bnd_ste_par_vals
-                in itertools.product(bool_vals, repeat=nste_bnds)]
-        return sgrs
+    expands one batch of assignments at a time, recursing until no
+    unassigned stereogenic atoms or bonds remain, so that the full
+    (2^n-sized) list is never held in memory at once
+    """
+    bool_vals = (False, True)
 
-    last_sgrs = []
-    sgrs = [without_stereo_parities(gra)]
+    atm_ste_keys = stereogenic_atom_keys(sgr)
+    if atm_ste_keys:
+        for atm_ste_par_vals in itertools.product(
+                bool_vals, repeat=len(atm_ste_keys)):
+            yield from _stereomers_iter(set_atom_stereo_parities(
+                sgr, dict(zip(atm_ste_keys, atm_ste_par_vals))))
+        return
 
-    while sgrs != last_sgrs:
-        last_sgrs = sgrs
-        sgrs = list(itertools.chain(*map(_expand_atom_stereo, sgrs)))
-        sgrs = list(itertools.chain(*map(_expand_bond_stereo, sgrs)))
+    bnd_ste_keys = stereogenic_bond_keys(sgr)
+    if bnd_ste_keys:
+        for bnd_ste_par_vals in itertools.product(
+                bool_vals, repeat=len(bnd_ste_keys)):
+            yield from _stereomers_iter(set_bond_stereo_parities(
+                sgr, dict(zip(bnd_ste_keys, bnd_ste_par_vals))))
+        return
 
-    return tuple(sorted(sgrs, key=frozen))
+    yield sgr
 
 
 def substereomers(gra):
@@ -219,7 +263,9 @@ def substereomers(gra):
                               set(bnd_ste_par_dct.items()))
         return _compat_atm_assgns and _compat_bnd_assgns
 
-    sgrs = tuple(filter(_is_compatible, stereomers(gra)))
+    sgrs = tuple(sorted(
+        filter(_is_compatible,
+               _stereomers_iter(without_stereo_parities(gra))), key=frozen))
     return sgrs
 
 
@@ -227,11 +273,12 @@ def stereo_sorted_atom_neighbor_keys(gra, atm_key, atm_ngb_keys):
     """ get the neighbor keys of an atom sorted by stereo priority
     """
     atm_ngb_keys = list(atm_ngb_keys)
+    pri_info = _cached_priority_info(gra)
 
     # explicitly create an object array because otherwise the argsort
     # interprets [()] as []
     atm_pri_vecs = numpy.empty(len(atm_ngb_keys), dtype=numpy.object_)
-    atm_pri_vecs[:] = [stereo_priority_vector(gra, atm_key, atm_ngb_key)
+    atm_pri_vecs[:] = [_stereo_priority_vector(pri_info, atm_key, atm_ngb_key)
                        for atm_ngb_key in atm_ngb_keys]
 
     sort_idxs = numpy.argsort(atm_pri_vecs)
@@ -33,6 +33,7 @@ from automol.graph._graph import union
 from automol.graph._graph import union_from_sequence
 from automol.graph._graph import connected_components
 from automol.graph._graph import full_isomorphism
+from automol.graph._graph import frozen
 from automol.graph._graph import add_bonds
 from automol.graph._graph import remove_bonds
 from automol.graph._graph import remove_atoms
@@ -53,11 +54,23 @@ def is_valid_reaction(rct_gras, prd_gras):
     return automol.formula.reac.is_valid_reaction(rct_fmls, prd_fmls)
 
 
+_TRIVIAL_CACHE = {}
+
+
 def is_trivial_reaction(rct_gras, prd_gras):
     """ is this a trivial reaction, with the same reactants and products?
+
+    (cached, since every reaction finder asks this question of the same
+    reagent lists during classification and the isomorphism checks are
+    expensive)
     """
-    tras, _, _ = trivial_reaction(rct_gras, prd_gras)
-    return bool(tras)
+    key = (tuple(map(frozen, rct_gras)), tuple(map(frozen, prd_gras)))
+    if key not in _TRIVIAL_CACHE:
+        if len(_TRIVIAL_CACHE) > 1000:
+            _TRIVIAL_CACHE.clear()
+        tras, _, _ = trivial_reaction(rct_gras, prd_gras)
+        _TRIVIAL_CACHE[key] = bool(tras)
+    return _TRIVIAL_CACHE[key]
 
 
 def trivial_reaction(rct_gras, prd_gras):
@@ -521,13 +534,14 @@ def classify(rct_gras, prd_gras):
     """ classify a reaction
     """
 
-    # check whether this is a valid reaction
-    rct_fmls = list(map(automol.formula.string,
-                        map(automol.convert.graph.formula, rct_gras)))
-    prd_fmls = list(map(automol.formula.string,
-                        map(automol.convert.graph.formula, prd_gras)))
-    assert is_valid_reaction(rct_gras, prd_gras), (
-        "Invalid reaction: {:s} -> {:s}".format(str(rct_fmls), str(prd_fmls)))
+    # check whether this is a valid reaction, reusing the formulas computed
+    # for the error message rather than recomputing them from the graphs
+    rct_fmls = list(map(automol.convert.graph.formula, rct_gras))
+    prd_fmls = list(map(automol.convert.graph.formula, prd_gras))
+    assert automol.formula.reac.is_valid_reaction(rct_fmls, prd_fmls), (
+        "Invalid reaction: {:s} -> {:s}".format(
+            str(list(map(automol.formula.string, rct_fmls))),
+            str(list(map(automol.formula.string, prd_fmls)))))
 
     for rxn_finder in REACTION_FINDER_DCT.values():
         tras, rct_idxs, prd_idxs = rxn_finder(rct_gras, prd_gras)
@@ -732,17 +746,36 @@ def _unique_gras(gra_lst):
         # Initialize list with first element
         uni_gras += (gra_lst[0],)
 
+        # join each unique entry's components and compute its formula only
+        # once, on first comparison
+        uni_cache = {}
+
+        def _joined_and_formula(idx):
+            if idx not in uni_cache:
+                joined_gra = union(*uni_gras[idx])
+                uni_cache[idx] = (
+                    joined_gra, automol.convert.graph.formula(joined_gra))
+            return uni_cache[idx]
+
         # Test if the del_gra is isomorphic to any of the uni_del_gras
         for gra in gra_lst[1:]:
             new_uni = True
-            for uni_gra in uni_gras:
-                if len(gra) == 1:
-                    isodct = full_isomorphism(gra, uni_gra)
-                else:
-                    isodct = full_isomorphism(union(*gra), union(*uni_gra))
-                if isodct:
-                    new_uni = False
-                    break
+            if len(gra) == 1:
+                for uni_gra in uni_gras:
+                    if full_isomorphism(gra, uni_gra):
+                        new_uni = False
+                        break
+            else:
+                joined_gra = union(*gra)
+                fml = automol.convert.graph.formula(joined_gra)
+                for idx in range(len(uni_gras)):
+                    uni_joined_gra, uni_fml = _joined_and_formula(idx)
+                    # compare the cheap formulas first; only run the
+                    # expensive isomorphism test on a formula match
+                    if fml == uni_fml and full_isomorphism(
+                            joined_gra, uni_joined_gra):
+                        new_uni = False
+                        break
 
             # Add graph and idx to lst if del gra is unique
             if new_uni:
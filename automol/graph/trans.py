@@ -3,8 +3,8 @@
 import numbers
 import yaml
 from automol import par
-from automol import dict_
 from automol.graph._graph import relabel as _relabel
+from automol.graph._graph import frozen
 from automol.graph._graph import full_isomorphism
 from automol.graph._graph import atom_neighbor_keys
 from automol.graph._graph import add_bonds
@@ -22,8 +22,8 @@ from automol.graph.reac import reverse_class
 def old_from_data(frm_bnd_keys, brk_bnd_keys):
     """ define a transformation from data
     """
-    frm_bnd_keys = frozenset(map(frozenset, frm_bnd_keys))
-    brk_bnd_keys = frozenset(map(frozenset, brk_bnd_keys))
+    frm_bnd_keys = _frozen_bond_keys(frm_bnd_keys)
+    brk_bnd_keys = _frozen_bond_keys(brk_bnd_keys)
     assert all(map(_is_bond_key, frm_bnd_keys))
     assert all(map(_is_bond_key, brk_bnd_keys))
     assert not frm_bnd_keys & brk_bnd_keys
@@ -103,8 +103,8 @@ def old_from_string(tra_str):
 def from_data(rxn_class, frm_bnd_keys, brk_bnd_keys):
     """ define a transformation from data
     """
-    frm_bnd_keys = frozenset(map(frozenset, frm_bnd_keys))
-    brk_bnd_keys = frozenset(map(frozenset, brk_bnd_keys))
+    frm_bnd_keys = _frozen_bond_keys(frm_bnd_keys)
+    brk_bnd_keys = _frozen_bond_keys(brk_bnd_keys)
     assert all(map(_is_bond_key, frm_bnd_keys))
     assert all(map(_is_bond_key, brk_bnd_keys))
     assert not frm_bnd_keys & brk_bnd_keys
@@ -237,29 +237,58 @@ def reverse(tra, xgr1, xgr2):
     return rev_tra
 
 
+_ISO_CACHE = {}
+
+
+def _cached_isomorphism(tra, cgr1, cgr2):
+    """ isomorphism of the transformed graph onto the products graph
+
+    (cached, since when looping over the stereomers of the reagents the
+    stereo-stripped graphs -- and hence this expensive isomorphism -- are
+    the same on every iteration)
+    """
+    key = (tra, frozen(cgr1), frozen(cgr2))
+    if key not in _ISO_CACHE:
+        if len(_ISO_CACHE) > 100:
+            _ISO_CACHE.clear()
+        _ISO_CACHE[key] = full_isomorphism(apply(tra, cgr1), cgr2)
+    return _ISO_CACHE[key]
+
+
 def is_stereo_compatible(tra, sgr1, sgr2):
     """ is this transformation compatible with the reactant/product stereo
     assignments?
     """
+    # if either side carries no stereo assignments there are no conserved
+    # stereo centers to check, so the transformation is trivially compatible
+    if not ((atom_stereo_keys(sgr1) or bond_stereo_keys(sgr1)) and
+            (atom_stereo_keys(sgr2) or bond_stereo_keys(sgr2))):
+        return True
+
     cgr1 = without_stereo_parities(sgr1)
     cgr2 = without_stereo_parities(sgr2)
-    atm_key_dct = full_isomorphism(apply(tra, cgr1), cgr2)
+    atm_key_dct = _cached_isomorphism(tra, cgr1, cgr2)
 
     # determine the stereo centers which are preserved in the transformation
     sgr1 = _relabel(sgr1, atm_key_dct)
     atm_keys = sorted(atom_stereo_keys(sgr1) & atom_stereo_keys(sgr2))
     bnd_keys = sorted(bond_stereo_keys(sgr1) & bond_stereo_keys(sgr2))
 
-    atm_pars1 = dict_.values_by_key(atom_stereo_parities(sgr1), atm_keys)
-    atm_pars2 = dict_.values_by_key(atom_stereo_parities(sgr2), atm_keys)
-    bnd_pars1 = dict_.values_by_key(bond_stereo_parities(sgr1), bnd_keys)
-    bnd_pars2 = dict_.values_by_key(bond_stereo_parities(sgr2), bnd_keys)
+    atm_par_dct1 = atom_stereo_parities(sgr1)
+    atm_par_dct2 = atom_stereo_parities(sgr2)
+    bnd_par_dct1 = bond_stereo_parities(sgr1)
+    bnd_par_dct2 = bond_stereo_parities(sgr2)
+
+    atm_pars1 = [atm_par_dct1[atm_key] for atm_key in atm_keys]
+    atm_pars2 = [atm_par_dct2[atm_key] for atm_key in atm_keys]
+    bnd_pars1 = [bnd_par_dct1[bnd_key] for bnd_key in bnd_keys]
+    bnd_pars2 = [bnd_par_dct2[bnd_key] for bnd_key in bnd_keys]
 
     atm_ngb_keys_dct1 = atom_neighbor_keys(sgr1)
     atm_ngb_keys_dct2 = atom_neighbor_keys(sgr2)
 
-    ret = True
-
+    # return at the first incompatible stereo center, skipping the expensive
+    # neighbor sorts for the remaining ones
     for atm_key, par1, par2 in zip(atm_keys, atm_pars1, atm_pars2):
         atm_ngb_keys1 = stereo_sorted_atom_neighbor_keys(
             sgr1, atm_key, atm_ngb_keys_dct1[atm_key])
@@ -267,9 +296,11 @@ def is_stereo_compatible(tra, sgr1, sgr2):
             sgr2, atm_key, atm_ngb_keys_dct2[atm_key])
 
         if _permutation_parity(atm_ngb_keys1, atm_ngb_keys2):
-            ret &= (par1 == par2)
+            if par1 != par2:
+                return False
         else:
-            ret &= (par1 != par2)
+            if par1 == par2:
+                return False
 
     for bnd_key, par1, par2 in zip(bnd_keys, bnd_pars1, bnd_pars2):
         atm1_key, atm2_key = bnd_key
@@ -285,11 +316,13 @@ def is_stereo_compatible(tra, sgr1, sgr2):
 
         if not ((atm1_ngb_key1 != atm1_ngb_key2) ^
                 (atm2_ngb_key1 != atm2_ngb_key2)):
-            ret &= (par1 == par2)
+            if par1 != par2:
+                return False
         else:
-            ret &= (par1 != par2)
+            if par1 == par2:
+                return False
 
-    return ret
+    return True
 
 
 def _permutation_parity(seq, ref_seq):
@@ -309,6 +342,15 @@ def _permutation_parity(seq, ref_seq):
     return parity
 
 
+def _frozen_bond_keys(bnd_keys):
+    # internal callers mostly pass frozensets of frozensets already, in
+    # which case the O(N) re-wrapping can be skipped
+    if not (isinstance(bnd_keys, frozenset) and
+            all(isinstance(key, frozenset) for key in bnd_keys)):
+        bnd_keys = frozenset(map(frozenset, bnd_keys))
+    return bnd_keys
+
+
 def _is_bond_key(obj):
     return (isinstance(obj, frozenset) and len(obj) == 2 and
             all(map(_is_atom_key, obj)))
@@ -2,6 +2,7 @@
 """
 import itertools
 import functools
+import multiprocessing
 import numpy
 import autoparse.pattern as app
 import autoparse.find as apf
@@ -337,12 +338,20 @@ def formula_string(ich):
     return formula_sublayer(ich)
 
 
-def add_stereo(ich):
+def add_stereo(ich, nprocs=1):
     """ inchi => inchi after adding stereoinfo
+
+    the stereomer conversions are independent, so for large expansions
+    they can be distributed over `nprocs` processes
     """
     gra = automol.inchi.graph(ich)
     stereo_gras = automol.graph.stereomers(gra)
-    return list(map(automol.graph.inchi, stereo_gras))
+    if nprocs > 1 and len(stereo_gras) > 8:
+        with multiprocessing.Pool(processes=nprocs) as pool:
+            ichs = pool.map(automol.graph.inchi, stereo_gras)
+    else:
+        ichs = list(map(automol.graph.inchi, stereo_gras))
+    return ichs
 
 
 def _sublayers(lyr):
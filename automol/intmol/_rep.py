@@ -28,9 +28,6 @@ def low_repulsion_struct(zma_ref, zma_samp, pairs='offdiag', thresh=40.0):
         sum_ref += pot_mat[idx1, idx2]
         sum_samp += pot_mat_samp[idx1, idx2]
 
-    print('long_range_pots {:.2f} {:.2f} {:.2f}'.format(
-        sum_ref, sum_samp, sum_samp-sum_ref))
-
     # # Check if the potentials are within threshold
     low_repulsion = bool((sum_samp - sum_ref) <= thresh)
 
@@ -28,23 +28,36 @@ def is_reation_class(rclass):
     return rclass in _values(REACTION_CLASS)
 
 
+_VALUES_CACHE = {}
+
+
 def _values(cls):
     """ list the values of a parameter class
+
+        (cached by class, since the inspect scan is slow and the
+        parameter classes never change at runtime)
     """
     assert inspect.isclass(cls)
-    vals = tuple(val for val in _public_attributes(cls)
-                 if not inspect.isclass(val))
-    return vals
+    if cls not in _VALUES_CACHE:
+        _VALUES_CACHE[cls] = tuple(val for val in _public_attributes(cls)
+                                   if not inspect.isclass(val))
+    return _VALUES_CACHE[cls]
+
+
+_ALL_VALUES_CACHE = {}
 
 
 def all_values(cls):
     """ recursively list the values of a parameter class tree
+
+        (cached by class, like _values)
     """
     assert inspect.isclass(cls)
-    vals = tuple(itertools.chain(*(
-        [val] if not inspect.isclass(val) else all_values(val)
-        for val in _public_attributes(cls))))
-    return vals
+    if cls not in _ALL_VALUES_CACHE:
+        _ALL_VALUES_CACHE[cls] = tuple(itertools.chain(*(
+            [val] if not inspect.isclass(val) else all_values(val)
+            for val in _public_attributes(cls))))
+    return _ALL_VALUES_CACHE[cls]
 
 
 def _public_attributes(cls):